@@ -1,9 +1,18 @@
 # airflow/dags/manufacturing_etl_dag.py
+import os
+import shlex
 from datetime import datetime, timedelta
 from airflow import DAG
-from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
 
+# Repository root holding the src package; BashOperator otherwise runs in a throwaway temp dir
+PROJECT_ROOT = os.getenv(
+    'MANUFACTURING_ANALYTICS_HOME',
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+)
+# Absolute so the extract and its refresh state persist between runs
+OLAP_EXTRACT_DIR = os.getenv('OLAP_EXTRACT_DIR', os.path.join(PROJECT_ROOT, 'data', 'olap'))
+
 default_args = {
     'owner': 'vihan',
     'depends_on_past': False,
@@ -22,21 +31,25 @@ dag = DAG(
     catchup=False,
 )
 
-def run_etl():
-    from src.data_ingestion.etl_pipeline import ETLPipeline
-    pipeline = ETLPipeline()
-    return pipeline.run_pipeline()
-
-etl_task = PythonOperator(
+etl_task = BashOperator(
     task_id='run_etl_pipeline',
-    python_callable=run_etl,
+    bash_command='python -m src.data_ingestion etl',
+    cwd=PROJECT_ROOT,
     dag=dag,
 )
 
 data_quality_check = BashOperator(
     task_id='data_quality_check',
-    bash_command='python src/data_quality/validate_data.py',
+    bash_command='python -m src.data_ingestion validate',
+    cwd=PROJECT_ROOT,
+    dag=dag,
+)
+
+refresh_olap_extract = BashOperator(
+    task_id='refresh_olap_extract',
+    bash_command=f'python -m src.data_ingestion extract --extract-dir {shlex.quote(OLAP_EXTRACT_DIR)}',
+    cwd=PROJECT_ROOT,
     dag=dag,
 )
 
-etl_task >> data_quality_check
\ No newline at end of file
+etl_task >> data_quality_check >> refresh_olap_extract
\ No newline at end of file
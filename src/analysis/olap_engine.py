@@ -0,0 +1,368 @@
+"""
+Columnar OLAP engine for dashboard rollups.
+
+fact_production is joined with dim_date, dim_machine and dim_product once,
+written as a denormalized Parquet extract partitioned by year/month, and
+queried with DuckDB. Refreshes are incremental on production_id, so BI
+exploration runs on vectorized, multi-threaded scans instead of repeated
+star joins against PostgreSQL.
+"""
+
+import json
+import logging
+import os
+import shutil
+
+import duckdb
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CUBE_TABLE = 'production_cube'
+STATE_FILE = '_refresh_state.json'
+
+# Attributes that can be grouped on or filtered by
+DIMENSION_ATTRIBUTES = [
+    'full_date', 'year', 'quarter', 'month', 'fiscal_year', 'day_of_week', 'is_weekend',
+    'machine_id', 'machine_name', 'machine_type', 'location',
+    'product_id', 'product_name', 'product_category',
+    'shift_number', 'operator_id',
+]
+
+MEASURES = {
+    'records': 'COUNT(*)',
+    'total_production': 'SUM(quantity_produced)',
+    'total_defects': 'SUM(defects)',
+    'defect_rate_percentage': 'ROUND(SUM(defects) * 100.0 / NULLIF(SUM(quantity_produced), 0), 2)',
+    'avg_oee': 'ROUND(AVG(oee_percentage), 2)',
+    'total_downtime': 'SUM(downtime_minutes)',
+    'energy_consumption_kwh': 'ROUND(SUM(energy_consumption_kwh), 2)',
+    'revenue': 'ROUND(SUM(quantity_produced * unit_price), 2)',
+    'production_cost': 'ROUND(SUM(quantity_produced * cost_price), 2)',
+}
+
+# Predefined rollups backing the Tableau dashboards
+CUBES = {
+    'daily_production': (['full_date'], ['total_production', 'total_defects', 'avg_oee', 'total_downtime']),
+    'machine_performance': (['machine_id', 'machine_name', 'machine_type'],
+                            ['records', 'total_production', 'avg_oee', 'defect_rate_percentage', 'total_downtime']),
+    'location_quarterly': (['location', 'year', 'quarter'], ['total_production', 'avg_oee', 'total_downtime']),
+    'category_fiscal_year': (['product_category', 'fiscal_year'],
+                             ['total_production', 'revenue', 'production_cost', 'defect_rate_percentage']),
+    'shift_quality': (['shift_number', 'machine_type'], ['total_production', 'defect_rate_percentage', 'avg_oee']),
+}
+
+# Extract columns with their warehouse types (PostgreSQL_Schema.sql). Every
+# column is cast explicitly so that Parquet files written from different
+# batches share one schema, even when a batch has an all-NULL column.
+CUBE_COLUMNS = [
+    ('f.production_id', 'INTEGER'),
+    ('f.shift_number', 'INTEGER'),
+    ('f.operator_id', 'VARCHAR'),
+    ('f.quantity_produced', 'INTEGER'),
+    ('f.defects', 'INTEGER'),
+    ('f.rework_count', 'INTEGER'),
+    ('f.downtime_minutes', 'INTEGER'),
+    ('f.setup_time_minutes', 'INTEGER'),
+    ('f.quality_score', 'DECIMAL(5,2)'),
+    ('f.inspection_passed', 'BOOLEAN'),
+    ('f.energy_consumption_kwh', 'DECIMAL(10,2)'),
+    ('f.raw_material_used_kg', 'DECIMAL(10,2)'),
+    ('f.scrap_weight_kg', 'DECIMAL(10,2)'),
+    ('f.oee_percentage', 'DECIMAL(5,2)'),
+    ('f.availability_percentage', 'DECIMAL(5,2)'),
+    ('f.performance_percentage', 'DECIMAL(5,2)'),
+    ('f.quality_percentage', 'DECIMAL(5,2)'),
+    ('f.start_time', 'TIMESTAMP'),
+    ('f.end_time', 'TIMESTAMP'),
+    ('d.full_date', 'DATE'),
+    ('d.year', 'INTEGER'),
+    ('d.quarter', 'INTEGER'),
+    ('d.month', 'INTEGER'),
+    ('d.fiscal_year', 'INTEGER'),
+    ('d.day_of_week', 'INTEGER'),
+    ('d.is_weekend', 'BOOLEAN'),
+    ('m.machine_id', 'VARCHAR'),
+    ('m.machine_name', 'VARCHAR'),
+    ('m.machine_type', 'VARCHAR'),
+    ('m.location', 'VARCHAR'),
+    ('p.product_id', 'VARCHAR'),
+    ('p.product_name', 'VARCHAR'),
+    ('p.product_category', 'VARCHAR'),
+    ('p.unit_price', 'DECIMAL(10,2)'),
+    ('p.cost_price', 'DECIMAL(10,2)'),
+]
+
+_CUBE_SELECT = ',\n    '.join(f"CAST({column} AS {sql_type}) AS {column.split('.')[1]}"
+                               for column, sql_type in CUBE_COLUMNS)
+
+# Pre-join executed in DuckDB over the registered source tables
+DENORMALIZE_QUERY = f"""
+SELECT
+    {_CUBE_SELECT}
+FROM fact_batch f
+JOIN dim_date d ON f.date_id = d.date_id
+JOIN dim_machine m ON f.machine_id = m.machine_id
+JOIN dim_product p ON f.product_id = p.product_id
+"""
+
+
+class OLAPEngine:
+    """DuckDB query engine over a partitioned Parquet extract of the warehouse"""
+
+    def __init__(self, extract_dir='data/olap', threads=None):
+        self.extract_dir = extract_dir
+        self.cube_dir = os.path.join(extract_dir, CUBE_TABLE)
+        self.conn = duckdb.connect()
+        if threads:
+            self.conn.execute(f"SET threads TO {int(threads)}")
+
+    def load_state(self):
+        """Refresh state of the published extract, or None before the first refresh"""
+        try:
+            with open(os.path.join(self.extract_dir, STATE_FILE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def last_production_id(self):
+        """High-water mark of fact rows already in the extract"""
+        state = self.load_state()
+        return state['last_production_id'] if state else 0
+
+    def refresh(self, engine=None, full=False, batch_rows=500_000):
+        """Append fact rows newer than the high-water mark from PostgreSQL
+
+        Falls back to a full rebuild when fact_production no longer matches the
+        stored state, e.g. after TRUNCATE ... RESTART IDENTITY. Dimensions are
+        re-read on every refresh; a full refresh is needed for attribute
+        changes to reach rows that are already in the extract.
+        """
+        from sqlalchemy import create_engine, text
+
+        from ..data_ingestion.db import get_connection_string
+
+        engine = engine or create_engine(get_connection_string())
+        # Keyset pagination keeps at most one batch in client memory
+        query = text("SELECT * FROM fact_production WHERE production_id > :last_id "
+                     "ORDER BY production_id LIMIT :batch_rows")
+
+        with engine.connect() as conn:
+            state = None if full else self.load_state()
+            if state and not self._source_matches(conn, state):
+                logger.warning("fact_production changed below the high-water mark, rebuilding OLAP extract")
+                state = None
+
+            dims = {name: pd.read_sql(text(f"SELECT * FROM {name}"), conn)
+                    for name in ('dim_date', 'dim_machine', 'dim_product')}
+
+            def batches():
+                last_id = state['last_production_id'] if state else 0
+                while True:
+                    batch = pd.read_sql(query, conn, params={'last_id': last_id, 'batch_rows': batch_rows})
+                    if batch.empty:
+                        return
+                    yield batch
+                    last_id = int(batch['production_id'].iloc[-1])
+
+            return self._build(state, dims, batches())
+
+    def refresh_from_parquet(self, source_dir, full=False):
+        """Append (or with ``full`` rebuild) the extract from per-table Parquet exports
+
+        Falls back to a full rebuild when the export no longer matches the
+        stored state, as ``refresh`` does.
+        """
+        def read(name):
+            return pd.read_parquet(os.path.join(source_dir, f"{name}.parquet"))
+
+        dims = {name: read(name) for name in ('dim_date', 'dim_machine', 'dim_product')}
+        facts = read('fact_production').sort_values('production_id', ignore_index=True)
+
+        state = None if full else self.load_state()
+        if state and not self._frame_matches(facts, state):
+            logger.warning("fact_production export changed below the high-water mark, rebuilding OLAP extract")
+            state = None
+        if state:
+            facts = facts[facts['production_id'] > state['last_production_id']]
+
+        return self._build(state, dims, [facts] if not facts.empty else [])
+
+    @staticmethod
+    def _source_matches(conn, state):
+        """Whether PostgreSQL still holds exactly the fact rows up to the high-water mark"""
+        from sqlalchemy import text
+
+        count, mark_created_at = conn.execute(text("""
+            SELECT COUNT(*), MAX(created_at) FILTER (WHERE production_id = :mark)
+            FROM fact_production
+            WHERE production_id <= :mark
+        """), {'mark': state['last_production_id']}).one()
+        return (count == state.get('row_count')
+                and _timestamp_key(mark_created_at) == state.get('mark_created_at'))
+
+    @staticmethod
+    def _frame_matches(facts, state):
+        """Whether an exported fact table still holds the rows up to the high-water mark"""
+        mark = state['last_production_id']
+        upto = facts[facts['production_id'] <= mark]
+        mark_created_at = None
+        if 'created_at' in upto:
+            mark_row = upto[upto['production_id'] == mark]
+            mark_created_at = mark_row['created_at'].iloc[0] if not mark_row.empty else None
+        return (len(upto) == state.get('row_count')
+                and _timestamp_key(mark_created_at) == state.get('mark_created_at'))
+
+    def _build(self, state, dims, batches):
+        """Write fact batches into a staging directory, then publish them
+
+        With ``state`` None the staged extract replaces the live one only after
+        every batch is written, so a failed rebuild leaves the old extract in
+        place. Otherwise the new partition files are moved into the live extract.
+        """
+        staging = self.extract_dir.rstrip(os.sep) + '.staging'
+        shutil.rmtree(staging, ignore_errors=True)
+
+        new_state = state or {'last_production_id': 0, 'row_count': 0, 'mark_created_at': None}
+        appended = 0
+        try:
+            for batch in batches:
+                self._append(batch, dims, os.path.join(staging, CUBE_TABLE))
+                appended += len(batch)
+                new_state = _advance_state(new_state, batch)
+
+            if state is None:
+                self._swap_in(staging, new_state)
+            elif appended:
+                self._merge_in(staging, new_state)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        logger.info(f"OLAP extract refreshed ({'full' if state is None else 'incremental'}): "
+                    f"{appended:,} new fact rows, high-water mark {new_state['last_production_id']}")
+        return appended
+
+    def _swap_in(self, staging, state):
+        os.makedirs(staging, exist_ok=True)
+        _write_state(staging, state)
+        retired = self.extract_dir.rstrip(os.sep) + '.old'
+        shutil.rmtree(retired, ignore_errors=True)
+        if os.path.exists(self.extract_dir):
+            os.rename(self.extract_dir, retired)
+        os.rename(staging, self.extract_dir)
+        shutil.rmtree(retired, ignore_errors=True)
+
+    def _merge_in(self, staging, state):
+        staged_cube = os.path.join(staging, CUBE_TABLE)
+        for root, _, files in os.walk(staged_cube):
+            target = os.path.join(self.cube_dir, os.path.relpath(root, staged_cube))
+            os.makedirs(target, exist_ok=True)
+            for name in files:
+                os.replace(os.path.join(root, name), os.path.join(target, name))
+        _write_state(self.extract_dir, state)
+
+    def _append(self, facts, dims, cube_dir):
+        """Denormalize one fact batch and write it into year/month partitions under ``cube_dir``"""
+        os.makedirs(cube_dir, exist_ok=True)
+        for name, df in dims.items():
+            self.conn.register(name, df)
+        self.conn.register('fact_batch', facts)
+        try:
+            # Unique file names per batch make OVERWRITE_OR_IGNORE behave as an append
+            self.conn.execute(f"""
+                COPY ({DENORMALIZE_QUERY}) TO '{cube_dir}'
+                (FORMAT PARQUET, PARTITION_BY (year, month),
+                 FILENAME_PATTERN 'part_{{uuid}}', OVERWRITE_OR_IGNORE)
+            """)
+        finally:
+            for name in ('fact_batch', *dims):
+                self.conn.unregister(name)
+
+    def _source(self):
+        state = self.load_state()
+        if state is None:
+            raise RuntimeError(f"No OLAP extract at {self.extract_dir}; "
+                               "run 'python -m src.data_ingestion extract' first")
+        if not os.path.isdir(self.cube_dir):
+            raise RuntimeError(f"OLAP extract at {self.extract_dir} is empty: fact_production had no rows "
+                               "at the last refresh; run 'python -m src.data_ingestion extract' again")
+        # Pin partition column types rather than relying on hive type inference
+        return (f"read_parquet('{self.cube_dir}/**/*.parquet', hive_partitioning = true, "
+                f"hive_types = {{'year': 'INTEGER', 'month': 'INTEGER'}})")
+
+    def query(self, group_by, measures=None, filters=None, order_by=None):
+        """Group-by rollup over any dimension attributes
+
+        ``filters`` maps an attribute to a value or a list of values; an empty
+        list selects nothing. Filters on ``year`` and ``month`` prune Parquet
+        partitions.
+        """
+        group_by = list(group_by)
+        measures = list(measures or MEASURES)
+        filters = filters or {}
+
+        for column in [*group_by, *filters]:
+            if column not in DIMENSION_ATTRIBUTES:
+                raise ValueError(f"Unknown dimension attribute: {column}")
+        for measure in measures:
+            if measure not in MEASURES:
+                raise ValueError(f"Unknown measure: {measure}")
+        for column in order_by or []:
+            if column not in group_by and column not in measures:
+                raise ValueError(f"Cannot order by {column}: not in group_by or measures")
+
+        select = [*group_by, *(f"{MEASURES[m]} AS {m}" for m in measures)]
+        sql = f"SELECT {', '.join(select)} FROM {self._source()}"
+
+        conditions, params = [], []
+        for column, value in filters.items():
+            if isinstance(value, (list, tuple, set)) and not value:
+                conditions.append("FALSE")
+            elif isinstance(value, (list, tuple, set)):
+                conditions.append(f"{column} IN ({', '.join('?' for _ in value)})")
+                params.extend(value)
+            else:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if group_by:
+            sql += f" GROUP BY {', '.join(group_by)}"
+            sql += f" ORDER BY {', '.join(order_by or group_by)}"
+
+        return self.conn.execute(sql, params).df()
+
+    def cube(self, name, **filters):
+        """Run one of the predefined dashboard rollups in ``CUBES``"""
+        try:
+            group_by, measures = CUBES[name]
+        except KeyError:
+            raise ValueError(f"Unknown cube '{name}', available: {', '.join(CUBES)}") from None
+        return self.query(group_by, measures, filters)
+
+    def close(self):
+        self.conn.close()
+
+
+def _timestamp_key(value):
+    """Comparable string for a created_at value from PostgreSQL, pandas or JSON"""
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value).isoformat()
+
+
+def _advance_state(state, batch):
+    """Refresh state after appending a fact batch ordered by production_id"""
+    last = batch.iloc[-1]
+    return {
+        'last_production_id': int(last['production_id']),
+        'row_count': state['row_count'] + len(batch),
+        'mark_created_at': _timestamp_key(last['created_at']) if 'created_at' in batch else None,
+    }
+
+
+def _write_state(extract_dir, state):
+    path = os.path.join(extract_dir, STATE_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(state, f)
+    os.replace(path + '.tmp', path)
@@ -0,0 +1,35 @@
+"""
+Data ingestion package for the manufacturing analytics warehouse.
+
+Stage modules pull in pandas, numpy, SQLAlchemy and psycopg2, so they are
+only imported when one of the names below is first accessed. Importing the
+package itself stays cheap enough for Airflow DAG parsing.
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'ETLPipeline': '.etl_pipeline',
+    'ManufacturingETL': '.etl_pipeline_fixed',
+    'generate_manufacturing_data': '.generate_data',
+    'LoadGenerator': '.load_generator',
+    'validate_warehouse': '.validate_data',
+    'get_provider': '.providers',
+    'register_provider': '.providers',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
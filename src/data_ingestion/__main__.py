@@ -0,0 +1,122 @@
+"""
+Command line entry point for the ingestion stages.
+
+    python -m src.data_ingestion generate --scale-factor 1
+    python -m src.data_ingestion etl --days 90
+    python -m src.data_ingestion validate
+    python -m src.data_ingestion extract
+
+Each subcommand imports its stage module only when it runs.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+
+def _generate(args):
+    from .db import get_connection_params
+    from .load_generator import LATENCY_TARGETS, LoadGenerator, measure_query_latency
+
+    conn_params = get_connection_params()
+    if args.dbname:
+        conn_params['dbname'] = args.dbname
+
+    generator = LoadGenerator(
+        scale_factor=args.scale_factor,
+        seed=args.seed,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        chunk_rows=args.chunk_rows,
+    )
+    generator.run(conn_params=conn_params, workers=args.workers, reset=args.reset)
+    if args.benchmark:
+        targets = LATENCY_TARGETS
+        if args.latency_target is not None:
+            targets = {query: args.latency_target for query in LATENCY_TARGETS}
+        _, misses = measure_query_latency(conn_params, targets=targets, repeats=args.benchmark_repeats)
+        if misses:
+            return 1
+    return 0
+
+
+def _etl(args):
+    from .etl_pipeline_fixed import ManufacturingETL
+
+    return 0 if ManufacturingETL().run_etl(num_days=args.days) else 1
+
+
+def _validate(args):
+    from .validate_data import validate_warehouse
+
+    return 1 if validate_warehouse() else 0
+
+
+def _extract(args):
+    from ..analysis.olap_engine import OLAPEngine
+
+    engine = OLAPEngine(extract_dir=args.extract_dir, threads=args.threads)
+    try:
+        engine.refresh(full=args.full)
+    finally:
+        engine.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src.data_ingestion',
+                                     description="Manufacturing analytics ingestion stages")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help="Bulk load synthetic data at a scale factor")
+    generate.add_argument('--scale-factor', type=float, default=1.0,
+                          help="1.0 = 1M fact_production rows")
+    generate.add_argument('--seed', type=int, default=42)
+    generate.add_argument('--start-date', default='2023-01-01')
+    generate.add_argument('--end-date', default='2025-12-31')
+    generate.add_argument('--chunk-rows', type=int, default=100_000)
+    generate.add_argument('--workers', type=int, default=None)
+    generate.add_argument('--dbname', default=None,
+                          help="Target database, overrides DB_NAME")
+    generate.add_argument('--reset', action='store_true',
+                          help="Truncate the star schema in the target database before loading")
+    generate.add_argument('--benchmark', action='store_true',
+                          help="Time the dashboard views after loading; exit 1 if any misses its target")
+    generate.add_argument('--benchmark-repeats', type=int, default=3)
+    generate.add_argument('--latency-target', type=float, default=None,
+                          help="Target in seconds for every benchmarked view (default: per-view targets)")
+    generate.set_defaults(func=_generate)
+
+    etl = subparsers.add_parser('etl', help="Run the production ETL pipeline")
+    etl.add_argument('--days', type=int, default=90)
+    etl.set_defaults(func=_etl)
+
+    validate = subparsers.add_parser('validate', help="Run data quality checks on the warehouse")
+    validate.set_defaults(func=_validate)
+
+    extract = subparsers.add_parser('extract', help="Refresh the partitioned Parquet extract for OLAP queries")
+    extract.add_argument('--extract-dir', default=os.getenv('OLAP_EXTRACT_DIR', 'data/olap'))
+    extract.add_argument('--threads', type=int, default=None)
+    extract.add_argument('--full', action='store_true',
+                         help="Rebuild the extract instead of appending new fact rows")
+    extract.set_defaults(func=_extract)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('etl_pipeline.log'),
+            logging.StreamHandler()
+        ]
+    )
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
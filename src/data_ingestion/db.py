@@ -0,0 +1,26 @@
+"""
+Database connection settings shared by the ingestion stages.
+"""
+
+import os
+
+
+def get_connection_params():
+    """Read PostgreSQL connection parameters from the environment"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': os.getenv('DB_PORT', '5432'),
+        'dbname': os.getenv('DB_NAME', 'manufacturing_analytics'),
+        'user': os.getenv('DB_USER', 'vihan'),
+        'password': os.getenv('DB_PASSWORD', 'Vihan'),
+    }
+
+
+def get_connection_string():
+    """SQLAlchemy URL built from the same environment settings"""
+    params = get_connection_params()
+    return (f"postgresql://{params['user']}:{params['password']}"
+            f"@{params['host']}:{params['port']}/{params['dbname']}")
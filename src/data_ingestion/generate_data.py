@@ -1,12 +1,11 @@
-import pandas as pd
-from faker import Faker
-import yfinance as yf
-from datetime import datetime, timedelta
-import numpy as np
+from .providers import get_provider
 
 def generate_manufacturing_data(start_date='2023-01-01', end_date='2024-01-01'):
     """Generate synthetic manufacturing data."""
-    fake = Faker()
+    import numpy as np
+    import pandas as pd
+
+    fake = get_provider('faker')
     dates = pd.date_range(start=start_date, end=end_date, freq='D')
 
     data = []
@@ -25,16 +24,6 @@ def generate_manufacturing_data(start_date='2023-01-01', end_date='2024-01-01'):
 
     return pd.DataFrame(data)
 
-# def get_financial_data(ticker='AAPL', period='1y'):
-#     """Get real Financial data from Yahoo Finance."""
-#     stock = yf.Ticker(ticker)
-#     hist = stock.history(period=period)
-#     return hist.reset_index()
-
-# if __name__ == "__main__":
-#     df_manufacturing = generate_manufacturing_data()
-#     print(df_manufacturing.head())
-
-#     df_financial = get_financial_data()
-#     print(df_financial.head())
-
+# Financial data comes from the optional 'yfinance' provider:
+#     get_financial_data = get_provider('yfinance')
+#     df_financial = get_financial_data(ticker='AAPL', period='1y')
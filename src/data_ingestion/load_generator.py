@@ -0,0 +1,357 @@
+"""
+Scalable synthetic load generator for capacity testing of the warehouse.
+
+Builds consistent dim_date / dim_machine / dim_product rows and a
+fact_production table at a configurable scale factor (SF1 = 1M fact rows)
+and streams everything into PostgreSQL through COPY in parallel chunks.
+
+Fact rows are drawn from random streams keyed on the seed and a fixed
+internal block of BLOCK_ROWS rows, so the generated rows depend only on the
+seed, scale factor and date range, not on chunk size or worker count.
+production_id is assigned by PostgreSQL in COPY commit order, which varies
+between parallel runs; compare runs on row content, not on production_id.
+"""
+
+import io
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import psycopg2
+
+from .db import get_connection_params
+
+logger = logging.getLogger(__name__)
+
+ROWS_PER_SCALE_FACTOR = 1_000_000
+DEFAULT_CHUNK_ROWS = 100_000
+BLOCK_ROWS = 10_000
+
+MACHINE_TYPES = ['Plastic', 'Metal', 'Assembly', 'Packaging', 'Inspection']
+PRODUCT_CATEGORIES = ['Consumer Electronics', 'Automotive', 'Medical', 'Toys', 'Industrial']
+
+# Shift 1 = 06-14h, 2 = 14-22h, 3 = 22-06h; night shift runs lighter and slower
+SHIFT_START_HOURS = np.array([6, 14, 22])
+SHIFT_WEIGHTS = np.array([0.45, 0.35, 0.20])
+SHIFT_PERFORMANCE = np.array([0.96, 0.94, 0.89])
+
+FACT_COLUMNS = [
+    'date_id', 'machine_id', 'product_id', 'shift_number', 'operator_id',
+    'quantity_produced', 'defects', 'rework_count', 'downtime_minutes',
+    'setup_time_minutes', 'quality_score', 'inspection_passed',
+    'energy_consumption_kwh', 'raw_material_used_kg', 'scrap_weight_kg',
+    'oee_percentage', 'availability_percentage', 'performance_percentage',
+    'quality_percentage', 'start_time', 'end_time'
+]
+
+# Dashboard-facing queries and their latency targets in seconds
+LATENCY_TARGETS = {
+    "SELECT * FROM vw_daily_production_summary": 1.0,
+    "SELECT * FROM vw_machine_performance": 1.0,
+}
+
+
+def machine_code(index):
+    """Machine business key shared by dim_machine and fact_production"""
+    return f"M{index + 1:05d}"
+
+
+def product_code(index):
+    """Product business key shared by dim_product and fact_production"""
+    return f"P{index + 1:05d}"
+
+
+class LoadGenerator:
+    """Generate and bulk load a star schema at a given scale factor"""
+
+    def __init__(self, scale_factor=1.0, seed=42, start_date='2023-01-01',
+                 end_date='2025-12-31', chunk_rows=DEFAULT_CHUNK_ROWS,
+                 zipf_exponent=1.1):
+        if scale_factor <= 0:
+            raise ValueError("scale_factor must be positive")
+
+        self.scale_factor = scale_factor
+        self.seed = seed
+        self.start_date = pd.Timestamp(start_date)
+        self.end_date = pd.Timestamp(end_date)
+        self.chunk_rows = chunk_rows
+        self.zipf_exponent = zipf_exponent
+
+        self.total_rows = int(ROWS_PER_SCALE_FACTOR * scale_factor)
+        # Dimensions grow sub-linearly so that larger scale factors mostly add depth
+        self.num_machines = max(5, int(50 * math.sqrt(scale_factor)))
+        self.num_products = max(5, int(500 * math.sqrt(scale_factor)))
+
+        self.dim_date = self.build_dim_date()
+        self.dim_machine = self.build_dim_machine()
+        self.dim_product = self.build_dim_product()
+
+    def _rng(self, *stream):
+        """Independent random stream keyed on the seed and a stream id"""
+        return np.random.default_rng([self.seed, *stream])
+
+    def build_dim_date(self):
+        """Calendar rows with explicit surrogate keys"""
+        dates = pd.date_range(self.start_date, self.end_date, freq='D')
+        return pd.DataFrame({
+            'date_id': np.arange(1, len(dates) + 1),
+            'full_date': dates.date,
+            'day': dates.day,
+            'month': dates.month,
+            'year': dates.year,
+            'quarter': dates.quarter,
+            'day_of_week': dates.dayofweek + 1,
+            'is_weekend': dates.dayofweek >= 5,
+            'fiscal_year': np.where(dates.month >= 4, dates.year, dates.year - 1),
+            'month_name': dates.month_name(),
+            'quarter_name': 'Q' + dates.quarter.astype(str),
+        })
+
+    def build_dim_machine(self):
+        """Machines with capacity, install date and maintenance interval"""
+        rng = self._rng(0, 1)
+        n = self.num_machines
+        types = rng.choice(MACHINE_TYPES, size=n)
+        age_days = rng.integers(180, 3650, size=n)
+        return pd.DataFrame({
+            'machine_id': [machine_code(i) for i in range(n)],
+            'machine_name': [f"{t} Machine {i + 1}" for i, t in enumerate(types)],
+            'machine_type': types,
+            'location': [f"Line {i % 20 + 1}" for i in range(n)],
+            'installation_date': (self.start_date - pd.to_timedelta(age_days, unit='D')).date,
+            'capacity_per_hour': np.round(rng.uniform(100, 1000, size=n), 2),
+            'maintenance_interval_days': rng.choice([30, 60, 90], size=n),
+            'status': 'Active',
+        })
+
+    def build_dim_product(self):
+        """Products with prices; row order doubles as Zipf popularity rank"""
+        rng = self._rng(0, 2)
+        n = self.num_products
+        cost = np.round(rng.uniform(1, 100, size=n), 2)
+        return pd.DataFrame({
+            'product_id': [product_code(i) for i in range(n)],
+            'product_name': [f"Product {i + 1}" for i in range(n)],
+            'product_category': rng.choice(PRODUCT_CATEGORIES, size=n),
+            'unit_price': np.round(cost * rng.uniform(1.2, 2.5, size=n), 2),
+            'cost_price': cost,
+            'weight_kg': np.round(rng.uniform(0.1, 20, size=n), 2),
+            'target_production_time_minutes': rng.integers(1, 60, size=n),
+        })
+
+    def _product_weights(self):
+        ranks = np.arange(1, self.num_products + 1)
+        weights = 1.0 / ranks ** self.zipf_exponent
+        return weights / weights.sum()
+
+    def _date_weights(self):
+        # Weekends run a skeleton crew
+        weights = np.where(self.dim_date['is_weekend'], 0.4, 1.0)
+        return weights / weights.sum()
+
+    def chunk_sizes(self):
+        """Row counts for each fact chunk"""
+        full, remainder = divmod(self.total_rows, self.chunk_rows)
+        return [self.chunk_rows] * full + ([remainder] if remainder else [])
+
+    def generate_fact_chunk(self, chunk_index):
+        """Generate the fact_production rows of one load chunk"""
+        start = chunk_index * self.chunk_rows
+        return self.generate_fact_rows(start, min(start + self.chunk_rows, self.total_rows))
+
+    def generate_fact_rows(self, start, stop):
+        """Generate fact rows ``start``..``stop`` of the dataset"""
+        first, last = start // BLOCK_ROWS, (stop - 1) // BLOCK_ROWS
+        blocks = pd.concat([self._generate_block(b) for b in range(first, last + 1)], ignore_index=True)
+        offset = first * BLOCK_ROWS
+        return blocks.iloc[start - offset:stop - offset].reset_index(drop=True)
+
+    def machine_wear(self, date_idx, machine_idx):
+        """Fraction of the maintenance interval elapsed (0 right after maintenance)"""
+        interval = self.dim_machine['maintenance_interval_days'].to_numpy()[machine_idx]
+        return ((date_idx + machine_idx * 7) % interval) / interval
+
+    def _generate_block(self, block_index):
+        rng = self._rng(1, block_index)
+        n = BLOCK_ROWS
+
+        date_idx = rng.choice(len(self.dim_date), size=n, p=self._date_weights())
+        machine_idx = rng.integers(0, self.num_machines, size=n)
+        product_idx = rng.choice(self.num_products, size=n, p=self._product_weights())
+        shift_idx = rng.choice(3, size=n, p=SHIFT_WEIGHTS)
+
+        # Machine degradation: wear builds up until the next scheduled maintenance
+        wear = self.machine_wear(date_idx, machine_idx)
+
+        availability = np.clip(rng.normal(0.95 - 0.12 * wear, 0.02), 0.5, 1.0)
+        performance = np.clip(rng.normal(SHIFT_PERFORMANCE[shift_idx] - 0.05 * wear, 0.02), 0.5, 1.0)
+
+        capacity = self.dim_machine['capacity_per_hour'].to_numpy()[machine_idx]
+        quantity = np.maximum(1, (capacity * 8 * availability * performance
+                                  * rng.uniform(0.3, 1.0, size=n)).astype(int))
+        defect_rate = np.clip(rng.normal(0.01 + 0.04 * wear, 0.005), 0, 0.2)
+        defects = rng.binomial(quantity, defect_rate)
+        quality = 1 - defects / quantity
+        oee = availability * performance * quality
+        downtime = np.round((1 - availability) * 480).astype(int)
+
+        full_dates = pd.to_datetime(self.dim_date['full_date'].to_numpy()[date_idx])
+        start_time = (full_dates
+                      + pd.to_timedelta(SHIFT_START_HOURS[shift_idx], unit='h')
+                      + pd.to_timedelta(rng.integers(0, 60, size=n), unit='m'))
+        end_time = start_time + pd.to_timedelta(rng.uniform(1, 8, size=n), unit='h')
+
+        return pd.DataFrame({
+            'date_id': self.dim_date['date_id'].to_numpy()[date_idx],
+            'machine_id': self.dim_machine['machine_id'].to_numpy()[machine_idx],
+            'product_id': self.dim_product['product_id'].to_numpy()[product_idx],
+            'shift_number': shift_idx + 1,
+            'operator_id': np.char.add('OP', (machine_idx * 3 + shift_idx).astype(str)),
+            'quantity_produced': quantity,
+            'defects': defects,
+            'rework_count': rng.binomial(defects, 0.3),
+            'downtime_minutes': downtime,
+            'setup_time_minutes': rng.integers(10, 30, size=n),
+            'quality_score': np.round(quality * 100, 2),
+            'inspection_passed': quality >= 0.97,
+            'energy_consumption_kwh': np.round(quantity * rng.uniform(0.1, 0.5, size=n), 2),
+            'raw_material_used_kg': np.round(quantity * rng.uniform(0.2, 1.0, size=n), 2),
+            'scrap_weight_kg': np.round(defects * rng.uniform(0.1, 0.3, size=n), 2),
+            'oee_percentage': np.round(oee * 100, 2),
+            'availability_percentage': np.round(availability * 100, 2),
+            'performance_percentage': np.round(performance * 100, 2),
+            'quality_percentage': np.round(quality * 100, 2),
+            'start_time': start_time,
+            'end_time': end_time,
+        }, columns=FACT_COLUMNS)
+
+    def load_dimensions(self, conn_params, reset=False):
+        """COPY dimension rows into an empty star schema
+
+        With ``reset`` the star schema is truncated first; otherwise loading
+        refuses to touch a warehouse that already holds data.
+        """
+        conn = psycopg2.connect(**conn_params)
+        try:
+            with conn, conn.cursor() as cur:
+                if reset:
+                    logger.info(f"Truncating fact_production and dimension tables in {conn_params['dbname']}...")
+                    cur.execute("TRUNCATE fact_production, dim_date, dim_machine, dim_product "
+                                "RESTART IDENTITY CASCADE")
+                else:
+                    cur.execute("SELECT EXISTS (SELECT 1 FROM fact_production) "
+                                "OR EXISTS (SELECT 1 FROM dim_date) "
+                                "OR EXISTS (SELECT 1 FROM dim_machine) "
+                                "OR EXISTS (SELECT 1 FROM dim_product)")
+                    if cur.fetchone()[0]:
+                        raise RuntimeError(
+                            f"Database {conn_params['dbname']} already contains warehouse data; "
+                            "pass reset=True (--reset) to truncate it or target a scratch database"
+                        )
+                for table, df in (('dim_date', self.dim_date),
+                                  ('dim_machine', self.dim_machine),
+                                  ('dim_product', self.dim_product)):
+                    copy_dataframe(cur, table, df)
+                    logger.info(f"Loaded {len(df):,} rows into {table}")
+                # date_id was supplied explicitly, keep the SERIAL sequence in step
+                cur.execute("SELECT setval(pg_get_serial_sequence('dim_date', 'date_id'), "
+                            "(SELECT MAX(date_id) FROM dim_date))")
+        finally:
+            conn.close()
+
+    def load_facts(self, conn_params, workers=None):
+        """Generate and COPY fact chunks in parallel worker processes"""
+        sizes = self.chunk_sizes()
+        workers = workers or os.cpu_count() or 1
+        logger.info(f"Loading {self.total_rows:,} fact rows in {len(sizes)} chunks "
+                    f"with {workers} workers...")
+
+        loaded = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_load_fact_chunk, self, conn_params, i)
+                       for i in range(len(sizes))]
+            for future in as_completed(futures):
+                loaded += future.result()
+                logger.info(f"Loaded {loaded:,}/{self.total_rows:,} fact rows")
+        return loaded
+
+    def run(self, conn_params=None, workers=None, reset=False):
+        """Load dimensions then facts and refresh planner statistics"""
+        conn_params = conn_params or get_connection_params()
+        started = datetime.now()
+
+        self.load_dimensions(conn_params, reset=reset)
+        loaded = self.load_facts(conn_params, workers=workers)
+
+        conn = psycopg2.connect(**conn_params)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("ANALYZE dim_date, dim_machine, dim_product, fact_production")
+        finally:
+            conn.close()
+
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(f"Load generator finished: {loaded:,} fact rows in {elapsed:.1f}s "
+                    f"({loaded / max(elapsed, 1e-9):,.0f} rows/s)")
+        return loaded
+
+
+def copy_dataframe(cur, table, df):
+    """Stream a DataFrame into a table with COPY ... FROM STDIN"""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+    buffer.seek(0)
+    columns = ', '.join(df.columns)
+    cur.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+
+
+def _load_fact_chunk(generator, conn_params, chunk_index):
+    """Worker entry point: generate a chunk and COPY it on its own connection"""
+    df = generator.generate_fact_chunk(chunk_index)
+    conn = psycopg2.connect(**conn_params)
+    try:
+        with conn, conn.cursor() as cur:
+            copy_dataframe(cur, 'fact_production', df)
+    finally:
+        conn.close()
+    return len(df)
+
+
+def measure_query_latency(conn_params=None, targets=None, repeats=3):
+    """Time each query against its latency target
+
+    ``targets`` maps SQL to a target in seconds. Returns the median
+    wall-clock seconds per query (fetching all rows) and the queries whose
+    median misses the target.
+    """
+    conn_params = conn_params or get_connection_params()
+    targets = targets or LATENCY_TARGETS
+    results, misses = {}, []
+    conn = psycopg2.connect(**conn_params)
+    try:
+        with conn.cursor() as cur:
+            for query, target in targets.items():
+                timings = []
+                for _ in range(repeats):
+                    started = time.perf_counter()
+                    cur.execute(query)
+                    cur.fetchall()
+                    timings.append(time.perf_counter() - started)
+                results[query] = sorted(timings)[len(timings) // 2]
+                if results[query] > target:
+                    misses.append(query)
+                    logger.warning(f"MISSED {query}: median {results[query] * 1000:.1f} ms, "
+                                   f"target {target * 1000:.0f} ms")
+                else:
+                    logger.info(f"OK {query}: median {results[query] * 1000:.1f} ms, "
+                                f"target {target * 1000:.0f} ms")
+        conn.rollback()
+    finally:
+        conn.close()
+    return results, misses
@@ -0,0 +1,87 @@
+"""
+Optional data providers loaded on demand.
+
+Providers wrap third-party libraries (Faker, yfinance) that the core
+pipeline does not need. Nothing is imported until a provider is requested,
+and installed packages can add providers through the
+``manufacturing_analytics.providers`` entry point group.
+"""
+
+import importlib
+from importlib.metadata import entry_points
+
+ENTRY_POINT_GROUP = 'manufacturing_analytics.providers'
+
+_PROVIDERS = {}
+_entry_points_loaded = False
+
+
+def register_provider(name):
+    """Register a provider factory under ``name``"""
+    def decorator(factory):
+        _PROVIDERS[name] = factory
+        return factory
+    return decorator
+
+
+def _require(module_name, provider):
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"Provider '{provider}' needs the optional '{module_name}' package "
+            f"(pip install {module_name})"
+        ) from e
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    eps = entry_points()
+    # Python 3.9 returns a dict, 3.10+ a selectable EntryPoints object
+    group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, 'select') else eps.get(ENTRY_POINT_GROUP, [])
+    for ep in group:
+        _PROVIDERS.setdefault(ep.name, ep.load())
+    _entry_points_loaded = True
+
+
+def available_providers():
+    """Names of all built-in and plugin providers"""
+    _load_entry_points()
+    return sorted(_PROVIDERS)
+
+
+def get_provider(name, **kwargs):
+    """Build the provider registered under ``name``"""
+    if name not in _PROVIDERS:
+        _load_entry_points()
+    try:
+        factory = _PROVIDERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown provider '{name}', available: {', '.join(available_providers())}") from None
+    return factory(**kwargs)
+
+
+@register_provider('faker')
+def faker_provider(seed=None):
+    """Faker instance for names and other fake attributes"""
+    faker = _require('faker', 'faker')
+    fake = faker.Faker()
+    if seed is not None:
+        fake.seed_instance(seed)
+    return fake
+
+
+@register_provider('yfinance')
+def yfinance_provider():
+    """Callable returning Yahoo Finance price history as a DataFrame"""
+    yf = _require('yfinance', 'yfinance')
+
+    def get_financial_data(ticker='AAPL', period='1y'):
+        """Get real Financial data from Yahoo Finance."""
+        stock = yf.Ticker(ticker)
+        hist = stock.history(period=period)
+        return hist.reset_index()
+
+    return get_financial_data
@@ -0,0 +1,55 @@
+"""
+Data quality checks for the production star schema.
+"""
+
+import logging
+
+from .db import get_connection_string
+
+logger = logging.getLogger(__name__)
+
+# Each check counts offending rows; anything above zero fails validation
+CHECKS = {
+    'fact_production is not empty': """
+        SELECT CASE WHEN EXISTS (SELECT 1 FROM fact_production) THEN 0 ELSE 1 END
+    """,
+    'orphan date_id': """
+        SELECT COUNT(*) FROM fact_production fp
+        LEFT JOIN dim_date d ON fp.date_id = d.date_id
+        WHERE d.date_id IS NULL
+    """,
+    'orphan machine_id': """
+        SELECT COUNT(*) FROM fact_production fp
+        LEFT JOIN dim_machine m ON fp.machine_id = m.machine_id
+        WHERE m.machine_id IS NULL
+    """,
+    'orphan product_id': """
+        SELECT COUNT(*) FROM fact_production fp
+        LEFT JOIN dim_product p ON fp.product_id = p.product_id
+        WHERE p.product_id IS NULL
+    """,
+    'defects exceed quantity': """
+        SELECT COUNT(*) FROM fact_production WHERE defects > quantity_produced
+    """,
+    'oee out of range': """
+        SELECT COUNT(*) FROM fact_production
+        WHERE oee_percentage < 0 OR oee_percentage > 100
+    """,
+}
+
+
+def validate_warehouse(engine=None):
+    """Run all checks and return the names of those that failed"""
+    from sqlalchemy import create_engine, text
+
+    engine = engine or create_engine(get_connection_string())
+    failed = []
+    with engine.connect() as conn:
+        for name, query in CHECKS.items():
+            offending = conn.execute(text(query)).scalar()
+            if offending:
+                logger.error(f"Check failed: {name} ({offending})")
+                failed.append(name)
+            else:
+                logger.info(f"Check passed: {name}")
+    return failed
@@ -0,0 +1,60 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DAG_PATH = os.path.join(PROJECT_ROOT, 'airflow', 'dags', 'manufacturing_etl_dag.py')
+
+HEAVY_MODULES = ['pandas', 'numpy', 'sqlalchemy', 'faker', 'yfinance']
+
+STAGE_MODULES = [
+    'src.data_ingestion',
+    'src.data_ingestion.__main__',
+    'src.data_ingestion.db',
+    'src.data_ingestion.providers',
+    'src.data_ingestion.etl_pipeline',
+    'src.data_ingestion.etl_pipeline_fixed',
+    'src.data_ingestion.generate_data',
+    'src.data_ingestion.validate_data',
+]
+
+
+def _loaded_heavy_modules(script):
+    """Run ``script`` in a fresh interpreter and return the heavy modules it loaded"""
+    script = textwrap.dedent(script) + textwrap.dedent(f"""
+        import json, sys
+        print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))
+    """)
+    result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _airflow_installed():
+    # The repo's own airflow/ folder resolves as a namespace package without an origin
+    spec = importlib.util.find_spec('airflow')
+    return spec is not None and spec.origin is not None
+
+
+@pytest.mark.parametrize('module', STAGE_MODULES)
+def test_stage_module_import_is_lazy(module):
+    assert _loaded_heavy_modules(f"import importlib; importlib.import_module({module!r})") == []
+
+
+@pytest.mark.skipif(not _airflow_installed(), reason="Airflow not installed")
+def test_dag_parse_costs_no_more_than_airflow():
+    baseline = _loaded_heavy_modules("""
+        from airflow import DAG
+        from airflow.operators.bash import BashOperator
+    """)
+    with_dag = _loaded_heavy_modules(f"""
+        import importlib.util
+        spec = importlib.util.spec_from_file_location('manufacturing_etl_dag', {DAG_PATH!r})
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+    """)
+    assert set(with_dag) <= set(baseline)
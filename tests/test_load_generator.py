@@ -0,0 +1,131 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+pytest.importorskip('psycopg2')
+
+from src.data_ingestion import load_generator
+from src.data_ingestion.load_generator import LoadGenerator
+
+
+@pytest.fixture
+def generator():
+    return LoadGenerator(scale_factor=0.01, seed=7, chunk_rows=4000)
+
+
+@pytest.fixture
+def facts(generator):
+    return pd.concat([generator.generate_fact_chunk(i) for i in range(len(generator.chunk_sizes()))],
+                     ignore_index=True)
+
+
+def test_chunks_are_deterministic_regardless_of_order(generator):
+    chunks = range(len(generator.chunk_sizes()))
+    forward = [generator.generate_fact_chunk(i) for i in chunks]
+
+    other = LoadGenerator(scale_factor=0.01, seed=7, chunk_rows=4000)
+    backward = {i: other.generate_fact_chunk(i) for i in reversed(chunks)}
+
+    for i, chunk in enumerate(forward):
+        pd.testing.assert_frame_equal(chunk, backward[i])
+
+
+def test_dataset_does_not_depend_on_chunk_size(facts):
+    other = LoadGenerator(scale_factor=0.01, seed=7, chunk_rows=3333)
+    rechunked = pd.concat([other.generate_fact_chunk(i) for i in range(len(other.chunk_sizes()))],
+                          ignore_index=True)
+    pd.testing.assert_frame_equal(facts, rechunked)
+
+
+def test_different_seed_changes_output(generator):
+    other = LoadGenerator(scale_factor=0.01, seed=8, chunk_rows=4000)
+    assert not generator.generate_fact_chunk(0).equals(other.generate_fact_chunk(0))
+
+
+def test_chunk_sizes_cover_total_rows(generator, facts):
+    assert sum(generator.chunk_sizes()) == generator.total_rows == len(facts) == 10_000
+
+
+def test_fact_keys_exist_in_dimensions(generator, facts):
+    assert facts['date_id'].isin(generator.dim_date['date_id']).all()
+    assert facts['machine_id'].isin(generator.dim_machine['machine_id']).all()
+    assert facts['product_id'].isin(generator.dim_product['product_id']).all()
+
+
+def test_facts_satisfy_schema_checks(facts):
+    assert (facts['quantity_produced'] >= 0).all()
+    assert (facts['defects'] >= 0).all()
+    assert (facts['defects'] <= facts['quantity_produced']).all()
+    assert facts['oee_percentage'].between(0, 100).all()
+    assert facts['shift_number'].isin([1, 2, 3]).all()
+
+
+def test_dimensions_match_schema_conventions(generator):
+    assert (generator.dim_machine['status'] == 'Active').all()
+    dim_date = generator.dim_date.set_index('full_date')
+    assert dim_date.loc[pd.Timestamp('2024-03-31').date(), 'fiscal_year'] == 2023
+    assert dim_date.loc[pd.Timestamp('2024-04-01').date(), 'fiscal_year'] == 2024
+
+
+def test_product_mix_is_zipfian(generator, facts):
+    counts = facts['product_id'].value_counts().reindex(generator.dim_product['product_id'], fill_value=0)
+    assert counts.iloc[0] > counts.iloc[1] > counts.iloc[2]
+    # Frequency keeps falling with rank across the long tail
+    buckets = [counts.iloc[lo:hi].mean() for lo, hi in ((0, 5), (5, 20), (20, 60), (60, None))]
+    assert buckets == sorted(buckets, reverse=True)
+
+
+def test_night_shift_is_lighter_and_slower(facts):
+    by_shift = facts.groupby('shift_number')
+    counts = by_shift.size()
+    performance = by_shift['performance_percentage'].mean()
+    assert counts[3] < counts[1]
+    assert performance[3] < performance[1]
+
+
+def test_oee_degrades_with_machine_wear(generator, facts):
+    date_idx = facts['date_id'].to_numpy() - 1
+    machine_idx = facts['machine_id'].str[1:].astype(int).to_numpy() - 1
+    wear = generator.machine_wear(date_idx, machine_idx)
+
+    oee_by_wear = facts['oee_percentage'].groupby(pd.cut(wear, [0, 0.25, 0.5, 0.75, 1.0],
+                                                         include_lowest=True)).mean()
+    assert oee_by_wear.is_monotonic_decreasing
+
+
+class _FakeCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        pass
+
+    def fetchall(self):
+        return []
+
+
+class _FakeConnection:
+    def cursor(self):
+        return _FakeCursor()
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_measure_query_latency_reports_missed_targets(monkeypatch):
+    # perf_counter pairs for three runs of each query: 0.1s for 'fast', 2.0s for 'slow'
+    clock = iter([0.0, 0.1] * 3 + [0.0, 2.0] * 3)
+    monkeypatch.setattr(load_generator.psycopg2, 'connect', lambda **kw: _FakeConnection())
+    monkeypatch.setattr(load_generator.time, 'perf_counter', lambda: next(clock))
+
+    results, misses = load_generator.measure_query_latency(
+        conn_params={'dbname': 'test'}, targets={'fast': 1.0, 'slow': 1.0})
+
+    assert results == {'fast': 0.1, 'slow': 2.0}
+    assert misses == ['slow']
@@ -0,0 +1,189 @@
+import glob
+import os
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('duckdb')
+pytest.importorskip('pyarrow')
+
+from src.analysis.olap_engine import OLAPEngine
+from src.data_ingestion.load_generator import LoadGenerator
+
+
+def make_facts(generator, created_at='2024-06-01 02:00:00'):
+    facts = pd.concat([generator.generate_fact_chunk(i) for i in range(len(generator.chunk_sizes()))],
+                      ignore_index=True)
+    facts.insert(0, 'production_id', range(1, len(facts) + 1))
+    facts['created_at'] = pd.Timestamp(created_at)
+    return facts
+
+
+def export(source_dir, generator, facts):
+    for name in ('dim_date', 'dim_machine', 'dim_product'):
+        getattr(generator, name).to_parquet(os.path.join(source_dir, f"{name}.parquet"))
+    facts.to_parquet(os.path.join(source_dir, 'fact_production.parquet'))
+
+
+@pytest.fixture
+def generator():
+    return LoadGenerator(scale_factor=0.02, seed=3, chunk_rows=5000)
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    path = tmp_path / 'source'
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture
+def olap(tmp_path):
+    engine = OLAPEngine(str(tmp_path / 'olap'), threads=2)
+    yield engine
+    engine.close()
+
+
+def total_records(olap):
+    return int(olap.query([], ['records'])['records'].iloc[0])
+
+
+def test_full_then_incremental_refresh(olap, generator, source_dir):
+    facts = make_facts(generator)
+
+    export(source_dir, generator, facts.iloc[:12000])
+    assert olap.refresh_from_parquet(source_dir, full=True) == 12000
+    assert total_records(olap) == 12000
+
+    export(source_dir, generator, facts)
+    assert olap.refresh_from_parquet(source_dir, full=False) == 8000
+    assert olap.last_production_id() == 20000
+    assert total_records(olap) == 20000
+
+    # Nothing new: no rows appended, nothing duplicated
+    assert olap.refresh_from_parquet(source_dir, full=False) == 0
+    assert total_records(olap) == 20000
+
+
+def test_rollups_match_pandas(olap, generator, source_dir):
+    facts = make_facts(generator)
+    export(source_dir, generator, facts)
+    olap.refresh_from_parquet(source_dir)
+
+    result = olap.cube('machine_performance')
+    expected = facts.groupby('machine_id')['quantity_produced'].sum()
+    assert result.set_index('machine_id')['total_production'].astype(int).to_dict() == expected.to_dict()
+
+
+def test_partition_columns_are_integers(olap, generator, source_dir):
+    export(source_dir, generator, make_facts(generator))
+    olap.refresh_from_parquet(source_dir)
+
+    result = olap.query(['month'], ['records'], filters={'year': 2024})
+    assert result['month'].tolist() == list(range(1, 13))
+
+    ordered = olap.query(['year', 'month'], ['total_production'], order_by=['total_production'])
+    assert ordered['total_production'].is_monotonic_increasing
+
+
+def test_filters_with_lists(olap, generator, source_dir):
+    facts = make_facts(generator)
+    export(source_dir, generator, facts)
+    olap.refresh_from_parquet(source_dir)
+
+    machines = ['M00001', 'M00002']
+    result = olap.query(['machine_id'], ['records'], filters={'machine_id': machines})
+    assert result['machine_id'].tolist() == machines
+    assert result['records'].sum() == facts['machine_id'].isin(machines).sum()
+
+
+def test_source_reset_triggers_rebuild(olap, generator, source_dir):
+    export(source_dir, generator, make_facts(generator))
+    olap.refresh_from_parquet(source_dir)
+
+    # Reload with RESTART IDENTITY: ids start at 1 again with fewer rows
+    reloaded = make_facts(LoadGenerator(scale_factor=0.01, seed=4), created_at='2024-07-01 02:00:00')
+    export(source_dir, generator, reloaded)
+    olap.refresh_from_parquet(source_dir, full=False)
+    assert total_records(olap) == len(reloaded)
+
+    # Same ids and count as before, but rewritten rows: still detected
+    rewritten = reloaded.assign(created_at=pd.Timestamp('2024-08-01 02:00:00'))
+    export(source_dir, generator, rewritten)
+    olap.refresh_from_parquet(source_dir, full=False)
+    assert total_records(olap) == len(rewritten)
+    assert olap.load_state()['mark_created_at'] == pd.Timestamp('2024-08-01 02:00:00').isoformat()
+
+
+def test_failed_rebuild_keeps_previous_extract(olap, generator, source_dir):
+    facts = make_facts(generator)
+    export(source_dir, generator, facts)
+    olap.refresh_from_parquet(source_dir)
+
+    export(source_dir, generator, facts.drop(columns=['defects']))
+    with pytest.raises(Exception):
+        olap.refresh_from_parquet(source_dir, full=True)
+    assert total_records(olap) == len(facts)
+
+
+def test_batches_with_all_null_columns_share_one_schema(olap, generator):
+    facts = make_facts(generator)
+    first = facts.iloc[:500].copy()
+    first['operator_id'] = None
+
+    dims = {name: getattr(generator, name) for name in ('dim_date', 'dim_machine', 'dim_product')}
+
+    # Same batches a keyset-paginated refresh hands to the builder
+    olap._build(None, dims, [first, facts.iloc[500:]])
+
+    # Every Parquet file must carry the same physical type per column
+    files = glob.glob(os.path.join(olap.cube_dir, '**', '*.parquet'), recursive=True)
+    schema = olap.conn.execute(f"SELECT name, type FROM parquet_schema({files!r}) "
+                               "WHERE type IS NOT NULL").df()
+    assert (schema.groupby('name')['type'].nunique() == 1).all()
+
+    result = olap.query(['operator_id'], ['records'])
+    assert result['records'].sum() == len(facts)
+    assert result.loc[result['operator_id'].isna(), 'records'].iloc[0] == 500
+
+
+def test_empty_filter_list_selects_nothing(olap, generator, source_dir):
+    export(source_dir, generator, make_facts(generator))
+    olap.refresh_from_parquet(source_dir)
+
+    result = olap.query(['machine_id'], ['records'], filters={'machine_id': []})
+    assert result.empty
+    assert list(result.columns) == ['machine_id', 'records']
+
+
+def test_query_before_first_refresh(olap):
+    with pytest.raises(RuntimeError, match="No OLAP extract"):
+        olap.query(['machine_type'], ['records'])
+
+
+def test_empty_extract_then_first_rows(olap, generator, source_dir):
+    facts = make_facts(generator)
+    export(source_dir, generator, facts.iloc[:0])
+    assert olap.refresh_from_parquet(source_dir) == 0
+    with pytest.raises(RuntimeError, match="is empty"):
+        olap.cube('machine_performance')
+
+    export(source_dir, generator, facts)
+    assert olap.refresh_from_parquet(source_dir) == len(facts)
+    assert total_records(olap) == len(facts)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'group_by': ['not_a_column']},
+    {'group_by': ['machine_type'], 'measures': ['not_a_measure']},
+    {'group_by': ['machine_type'], 'filters': {'quantity_produced': 5}},
+    {'group_by': ['machine_type'], 'measures': ['records'], 'order_by': ['avg_oee']},
+])
+def test_query_rejects_unknown_names(olap, kwargs):
+    with pytest.raises(ValueError):
+        olap.query(**kwargs)
+
+
+def test_unknown_cube(olap):
+    with pytest.raises(ValueError):
+        olap.cube('not_a_cube')